@@ -8,6 +8,7 @@ from neomodel.relationship_manager import (
 
 class ZeroOrOne(RelationshipManager):
     """ A relationship to zero or one node. """
+    __slots__ = ()
     description = "zero or one relationship"
 
     def single(self):
@@ -45,6 +46,7 @@ class ZeroOrOne(RelationshipManager):
 
 class OneOrMore(RelationshipManager):
     """ A relationship to zero or more nodes. """
+    __slots__ = ()
     description = "one or more relationships"
 
     def single(self):
@@ -84,6 +86,7 @@ class One(RelationshipManager):
     """
     A relationship to a single node
     """
+    __slots__ = ()
     description = "one relationship"
 
     def single(self):
@@ -119,6 +122,11 @@ class One(RelationshipManager):
             "Cardinality one, cannot disconnect_all use reconnect."
         )
 
+    def replace(self, node, properties=None):
+        raise AttemptedCardinalityViolation(
+            "Cardinality one, cannot replace use reconnect."
+        )
+
     def connect(self, node, properties=None):
         """
         Connect a node
@@ -42,7 +42,7 @@ class ModelDefinitionException(NeomodelException):
         :param db_node_rel_class: Depending on the concrete class, this is either a Neo4j driver node object
                from the DBMS, or a data model class from an application's hierarchy.
         :param current_node_class_registry: Dictionary that maps frozenset of
-               node labels to model classes
+               node labels (or 1-tuples of relationship types) to model classes
         """
         self.db_node_rel_class = db_node_rel_class
         self.current_node_class_registry = current_node_class_registry
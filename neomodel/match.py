@@ -807,7 +807,18 @@ class Traversal(BaseSet):
         self.definition = definition
         self.target_class = definition['node_class']
         self.name = name
-        self.filters = []
+        # filters are never modified in place, refined traversals share them
+        self.filters = ()
+
+    def clone(self):
+        """
+        Copy this traversal so that it can be refined without affecting the original.
+
+        :return: Traversal
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        return clone
 
     def match(self, **kwargs):
         """
@@ -816,12 +827,13 @@ class Traversal(BaseSet):
             e.g: `.match(price__lt=10)`
 
         :param kwargs: see `NodeSet.filter()` for syntax
-        :return: self
+        :return: a new Traversal, this one is left unchanged
         """
+        traversal = self.clone()
         if kwargs:
             if self.definition.get('model') is None:
                 raise ValueError("match() with filter only available on relationships with a model")
             output = process_filter_args(self.definition['model'], kwargs)
             if output:
-                self.filters.append(output)
-        return self
+                traversal.filters = self.filters + (output,)
+        return traversal
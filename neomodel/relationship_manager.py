@@ -1,33 +1,35 @@
 import functools
-import inspect
 import sys
 from importlib import import_module
-from typing import List
-from uuid import UUID
+from typing import TYPE_CHECKING, List
 
 from .core import db
-from .exceptions import NotConnected, RelationshipClassRedefined
+from .exceptions import MultipleNodesReturned, NotConnected, RelationshipClassRedefined
 from .match import EITHER, INCOMING, OUTGOING, NodeSet, Traversal, \
     _rel_helper, _rel_merge_helper
 from .relationship import StructuredRel
-from .util import _get_node_properties, deprecated
+from .util import deprecated
 
+if TYPE_CHECKING:
+    from uuid import UUID
 
-# basestring python 3.x fallback
-try:
-    basestring
-except NameError:
-    basestring = str
+
+_DIRECTION_STR = {OUTGOING: 'a outgoing', INCOMING: 'a incoming', EITHER: 'either'}
+
+# how far up the stack RelationshipDefinition looks for the declaring module
+_MAX_FRAME_DEPTH = 8
 
 
 # check source node is saved and not deleted
 def check_source(fn):
-    fn_name = fn.func_name if hasattr(fn, 'func_name') else fn.__name__
+    action = fn.__name__
+    action_suffix = '.' + action
 
     @functools.wraps(fn)
     def checker(self, *args, **kwargs):
-        self.source._pre_action_check(self.name + '.' + fn_name)
+        self.source._pre_action_check(self.name + action_suffix)
         return fn(self, *args, **kwargs)
+    checker._action = action
     return checker
 
 # checks if obj is a direct subclass, 1 level
@@ -37,90 +39,186 @@ def is_direct_subclass(obj, classinfo):
             return True
     return False
 
+
+def _uuid_strings(uuids):
+    """
+    The driver only sends lists of strings, so convert uuids into one unless they already are.
+    """
+    if isinstance(uuids, list) and all(isinstance(uuid, str) for uuid in uuids):
+        return uuids
+    return [str(uuid) for uuid in uuids]
+
+
+def _definition_key(definition):
+    """
+    Hashable form of the parts of a relationship definition that shape its
+    Cypher pattern. These never change once the definition is built.
+    """
+    return definition['relation_type'], definition['direction']
+
+
+@functools.lru_cache(maxsize=None)
+def _rel_query(prefix, lhs, rhs, ident, definition_key, suffix=''):
+    """
+    Build (once) a query of the form `prefix + (lhs)-[ident:TYPE]-(rhs) + suffix`.
+    """
+    relation_type, direction = definition_key
+    rel = _rel_helper(lhs=lhs, rhs=rhs, ident=ident, relation_type=relation_type, direction=direction)
+    return prefix + rel + suffix
+
+
+@functools.lru_cache(maxsize=None)
+def _connect_query_prefix(source_label, dest_label, them_key):
+    return f"UNWIND $rows AS row MATCH (them:{dest_label}), (us:{source_label}) " \
+        f"WHERE {them_key}=row.them and id(us)=$self MERGE"
+
+
+@functools.lru_cache(maxsize=None)
+def _replace_query_prefix(definition_key, node_label, dest_label):
+    relation_type, direction = definition_key
+    old_rel = _rel_helper(lhs='us', rhs='old:' + node_label, ident='r_old',
+                          relation_type=relation_type, direction=direction)
+    # remove all existing relationships then fall through to the usual connect query
+    return "MATCH (us) WHERE id(us)=$self OPTIONAL MATCH " + old_rel + " DELETE r_old " \
+        f"WITH DISTINCT us UNWIND $rows AS row MATCH (them:{dest_label}) WHERE id(them)=row.them MERGE"
+
+
+@functools.lru_cache(maxsize=None)
+def _rel_merge_query(definition_key, property_names=(), unset=()):
+    """
+    Build (once) the MERGE pattern used by connect_helper for a set of
+    relationship properties, reading each row's values from `row.props`.
+    """
+    relation_type, direction = definition_key
+    # build place holders to pass to rel_helper
+    rp = {p: None if p in unset else 'row.props.' + p for p in property_names}
+    return _rel_merge_helper(lhs='us', rhs='them', ident='r', relation_type=relation_type,
+                             direction=direction, relation_properties=rp)
+
+
+@functools.lru_cache(maxsize=None)
+def _rel_model_hooks(rel_model):
+    """
+    Return whether a relationship model defines (pre_save, post_save) hooks.
+    """
+    return callable(getattr(rel_model, 'pre_save', None)), callable(getattr(rel_model, 'post_save', None))
+
+
+@functools.lru_cache(maxsize=None)
+def _reconnect_query(definition_key):
+    relation_type, direction = definition_key
+    old_rel = _rel_helper(lhs='us', rhs='old', ident='r', relation_type=relation_type, direction=direction)
+    new_rel = _rel_merge_helper(lhs='us', rhs='new', ident='r2', relation_type=relation_type, direction=direction)
+    # remove old relationship and create new one, copying over its properties
+    return "MATCH (us), (old), (new) " \
+        "WHERE id(us)=$self and id(old)=$old and id(new)=$new " \
+        "MATCH " + old_rel + \
+        " WITH us, new, r, properties(r) AS old_properties DELETE r" \
+        " MERGE" + new_rel + \
+        " SET r2 += old_properties RETURN count(r2)"
+
+
 class RelationshipManager(object):
     """
     Base class for all relationships managed through neomodel.
 
     I.e the 'friends' object in  `user.friends.all()`
     """
+    # managers are built for every relationship of every node instance
+    __slots__ = ('source', 'source_class', 'name', 'definition', '_definition_key', '_node_class',
+                 '_traversal_template', '_disconnect_all_q')
+
     def __init__(self, source, key, definition):
         self.source = source
         self.source_class = source.__class__
         self.name = key
         self.definition = definition
+        self._definition_key = _definition_key(definition)
+        self._node_class = definition['node_class']
+        self._traversal_template = None
+        self._disconnect_all_q = None
 
     def __str__(self):
-        direction = 'either'
-        if self.definition['direction'] == OUTGOING:
-            direction = 'a outgoing'
-        elif self.definition['direction'] == INCOMING:
-            direction = 'a incoming'
-
+        relation_type, direction = self._definition_key
         return "{0} in {1} direction of type {2} on node ({3}) of class '{4}'".format(
-            self.description, direction,
-            self.definition['relation_type'], self.source.id, self.source_class.__name__)
+            self.description, _DIRECTION_STR.get(direction, 'either'),
+            relation_type, self.source.id, self.source_class.__name__)
 
     def _check_node(self, obj):
         """check for valid node i.e correct class and is saved"""
-        if not issubclass(type(obj), self.definition['node_class']):
-            raise ValueError("Expected node of class " + self.definition['node_class'].__name__)
+        if not isinstance(obj, self._node_class):
+            raise ValueError("Expected node of class " + self._node_class.__name__)
         if not hasattr(obj, 'id'):
             raise ValueError("Can't perform operation on unsaved node " + repr(obj))
 
-    def connect_helper(self, query: str, properties=None, node=None, nodes=None):
+    def _start_end_classes(self, node_class):
+        """Return the (start, end) node classes of a rel between source and node_class"""
+        if self._definition_key[1] == INCOMING:
+            return node_class, self.source_class
+        return self.source_class, node_class
+
+    def connect_helper(self, query: str, rows, node_class):
         """
         Function to support both connect() and bulk_connect() functions.
 
-        The beginning of the query - either UNWIND or MATCH - is set in the function itself
-        and sent in the query parameter. The rest of the query in both connect() and
-        bulk_connect() is very similar so it is built and executed here.
+        The beginning of the query - an UNWIND over $rows followed by the MATCH of
+        `us` and `them` - is set by the caller and sent in the query parameter. Each row
+        holds the node to connect under 'them' and its relationship properties under
+        'props'. The MERGE is built here and all rows are sent in a single query
+        (one per distinct set of unset properties when using a relationship model).
 
+        :return: True, or a list of rel instances if the relationship has a model. The list
+            follows the order of rows, leaving out rows whose node could not be matched.
         """
-        if not self.definition['model'] and properties:
-            raise NotImplementedError(
-                "Relationship properties without using a relationship model "
-                "is no longer supported."
-            )
-
-        params = {}
         rel_model = self.definition['model']
-        rp = None  # rel_properties
 
-        if rel_model:
-            rp = {}
+        if not rel_model:
+            if any(row.get('props') for row in rows):
+                raise NotImplementedError(
+                    "Relationship properties without using a relationship model "
+                    "is no longer supported."
+                )
+            new_rel = _rel_merge_query(self._definition_key)
+            self.source.cypher(query + new_rel, {'rows': [{'them': row['them']} for row in rows]})
+            return True
+
+        has_pre_save, has_post_save = _rel_model_hooks(rel_model)
+
+        # None valued properties can't be part of the MERGE pattern,
+        # so rows are grouped by which of their properties are unset
+        batches = {}
+        for i, row in enumerate(rows):
+            properties = row.get('props')
             # need to generate defaults etc to create fake instance
             tmp = rel_model(**properties) if properties else rel_model()
-            # build params and place holders to pass to rel_helper
-            for p, v in rel_model.deflate(tmp.__properties__).items():
-                if v is not None:
-                    rp[p] = '$' + p
-                else:
-                    rp[p] = None
-                params[p] = v
+            props = rel_model.deflate(tmp.__properties__)
 
-            if hasattr(tmp, 'pre_save'):
+            if has_pre_save:
                 tmp.pre_save()
 
-        new_rel = _rel_merge_helper(lhs='us', rhs='them', ident='r', relation_properties=rp, **self.definition)
-        q = query + new_rel
+            unset = tuple(p for p, v in props.items() if v is None)
+            batches.setdefault(unset, []).append({'i': i, 'them': row['them'], 'props': props})
 
-        if node:
-            params['them'] = node.id
-        else:
-            params['them'] = "uuid"
-            params['uuids'] = nodes
+        start_cls, end_cls = self._start_end_classes(node_class)
+        # rel instances keyed by the index of the row they were created from
+        rel_instances = {}
+        for unset, batch in batches.items():
+            # unset properties are passed as top level parameters
+            params = dict.fromkeys(unset)
+            params['rows'] = batch
 
-        if not rel_model:
-            self.source.cypher(q, params)
-            return True
+            new_rel = _rel_merge_query(self._definition_key, tuple(batch[0]['props']), unset)
+            for i, rel_ in self.source.cypher(query + new_rel + " RETURN row.i, r", params)[0]:
+                rel_instance = rel_model.inflate(rel_)
+                rel_instance._start_node_class = start_cls
+                rel_instance._end_node_class = end_cls
 
-        rel_ = self.source.cypher(q + " RETURN r", params)[0][0][0]
-        rel_instance = self._set_start_end_cls(rel_model.inflate(rel_), node)
+                if has_post_save:
+                    rel_instance.post_save()
 
-        if hasattr(rel_instance, 'post_save'):
-            rel_instance.post_save()
+                rel_instances[i] = rel_instance
 
-        return rel_instance
+        return [rel_instances[i] for i in sorted(rel_instances)]
 
     @check_source
     def connect(self, node, properties=None):
@@ -133,48 +231,54 @@ class RelationshipManager(object):
         :return:
         """
         self._check_node(node)
-        source_label = self.source.__class__.__name__
-        dest_label = node.__class__.__name__
-        q = f"MATCH (them:{dest_label}), (us:{source_label}) WHERE id(them)=$them and id(us)=$self " \
-            "MERGE"
-        return self.connect_helper(q, properties, node)
+        q = _connect_query_prefix(self.source_class.__name__, node.__class__.__name__, 'id(them)')
+        rels = self.connect_helper(q, [{'them': node.id, 'props': properties}], node.__class__)
+        return rels[0] if self.definition['model'] else rels
 
-    def bulk_disconnect(self, nodes: List[UUID]):
+    def bulk_disconnect(self, nodes: 'List[UUID]', label=None):
         """
         Disconnect list of nodes from the source node
 
-        :param nodes: a list of node UUIDs which will be connected to the source node
+        :param nodes: a list of node UUIDs which will be disconnected from the source node
+        :param label: optional label for nodes in list, lets the uuid index be used
         """
-        if nodes:
-            nodes = [str(uuid) for uuid in nodes]
-            rel = _rel_helper(lhs='a', rhs='b', ident='r', **self.definition)
-            q = "MATCH (a), (b) WHERE id(a)=$self and b.uuid in $them " \
-                "MATCH " + rel + " DELETE r"
-            print(q, nodes)
-            self.source.cypher(q, {'them': nodes})
+        if not nodes:
+            return
+        nodes = _uuid_strings(nodes)
+        rhs = ('b:' + label if label else 'b') + ' {uuid: uuid}'
+        q = _rel_query("MATCH (a) WHERE id(a)=$self UNWIND $uuids AS uuid MATCH ",
+                       'a', rhs, 'r', self._definition_key, " DELETE r")
+        self.source.cypher(q, {'uuids': nodes})
 
     @check_source
-    def bulk_connect(self, nodes: List[UUID], label, properties=None):
+    def bulk_connect(self, nodes: 'List[UUID]', label, properties=None):
         """
         Connect a list of nodes to the source node.
 
         :param nodes: a list of node UUIDs which will be connected to the source node
         :param label: Label for nodes in list
-        :param properties: for the new relationship
-        :type: dict
-        :return:
+        :param properties: for the new relationships, either one dict used for
+            every relationship or a list of dicts, one per node
+        :type: dict or list
+        :return: True / list of rel instances, in the same order as nodes. Nodes
+            which can't be found are left out, so the list may be shorter than nodes.
 
         Unlike `connect()`, this function receives a list of node UUIDs,
         not a node instance. Using UNWIND, the query connects all nodes in
-        the list to the source node.
+        the list to the source node in a single round-trip.
         """
+        nodes = _uuid_strings(nodes)
         if nodes:
-            nodes = [str(uuid) for uuid in nodes]
-            source_label = self.source.__class__.__name__
-            q = f"UNWIND $uuids as uuid MATCH (them:{label}), (us:{source_label}) WHERE them.uuid=uuid " \
-                "and id(us)=$self MERGE"
-            return self.connect_helper(q, properties=properties, nodes=nodes)
-
+            if properties is None or isinstance(properties, dict):
+                properties = [properties] * len(nodes)
+            else:
+                properties = list(properties)
+            if len(properties) != len(nodes):
+                raise ValueError("Expected one properties dict per node, got {0} for {1} nodes".format(
+                    len(properties), len(nodes)))
+            rows = [{'them': uuid, 'props': props} for uuid, props in zip(nodes, properties)]
+            q = _connect_query_prefix(self.source_class.__name__, label, 'them.uuid')
+            return self.connect_helper(q, rows, self.definition['node_class'])
 
     @check_source
     def replace(self, node, properties=None):
@@ -184,10 +288,19 @@ class RelationshipManager(object):
         :param node:
         :param properties: for the new relationship
         :type: dict
-        :return:
+        :return: True / rel instance
         """
-        self.disconnect_all()
-        self.connect(node, properties)
+        cls = type(self)
+        if cls.connect is not RelationshipManager.connect \
+                or cls.disconnect_all is not RelationshipManager.disconnect_all:
+            # don't bypass the checks of a subclass overriding either of them
+            self.disconnect_all()
+            return self.connect(node, properties)
+
+        self._check_node(node)
+        q = _replace_query_prefix(self._definition_key, self._node_class.__label__, node.__class__.__name__)
+        rels = self.connect_helper(q, [{'them': node.id, 'props': properties}], node.__class__)
+        return rels[0] if self.definition['model'] else rels
 
     @check_source
     def relationship(self, node):
@@ -198,8 +311,8 @@ class RelationshipManager(object):
         :return: StructuredRel
         """
         self._check_node(node)
-        my_rel = _rel_helper(lhs='us', rhs='them', ident='r', **self.definition)
-        q = "MATCH " + my_rel + " WHERE id(them)=$them and id(us)=$self RETURN r LIMIT 1"
+        q = _rel_query("MATCH ", 'us', 'them', 'r', self._definition_key,
+                       " WHERE id(them)=$them and id(us)=$self RETURN r LIMIT 1")
         rels = self.source.cypher(q, {'them': node.id})[0]
         if not rels:
             return
@@ -218,22 +331,24 @@ class RelationshipManager(object):
         """
         self._check_node(node)
 
-        my_rel = _rel_helper(lhs='us', rhs='them', ident='r', **self.definition)
-        q = "MATCH " + my_rel + " WHERE id(them)=$them and id(us)=$self RETURN r "
+        q = _rel_query("MATCH ", 'us', 'them', 'r', self._definition_key,
+                       " WHERE id(them)=$them and id(us)=$self RETURN r ")
         rels = self.source.cypher(q, {'them': node.id})[0]
         if not rels:
             return []
 
-        rel_model = self.definition.get('model') or StructuredRel
-        return [self._set_start_end_cls(rel_model.inflate(rel[0]), node) for rel in rels]
+        inflate = (self.definition.get('model') or StructuredRel).inflate
+        start_cls, end_cls = self._start_end_classes(node.__class__)
+        rel_instances = []
+        for rel, in rels:
+            rel_instance = inflate(rel)
+            rel_instance._start_node_class = start_cls
+            rel_instance._end_node_class = end_cls
+            rel_instances.append(rel_instance)
+        return rel_instances
 
     def _set_start_end_cls(self, rel_instance, obj):
-        if self.definition['direction'] == INCOMING:
-            rel_instance._start_node_class = obj.__class__
-            rel_instance._end_node_class = self.source_class
-        else:
-            rel_instance._start_node_class = self.source_class
-            rel_instance._end_node_class = obj.__class__
+        rel_instance._start_node_class, rel_instance._end_node_class = self._start_end_classes(obj.__class__)
         return rel_instance
 
     @check_source
@@ -252,31 +367,11 @@ class RelationshipManager(object):
         self._check_node(new_node)
         if old_node.id == new_node.id:
             return
-        old_rel = _rel_helper(lhs='us', rhs='old', ident='r', **self.definition)
-
-        # get list of properties on the existing rel
-        result, meta = self.source.cypher(
-            "MATCH (us), (old) WHERE id(us)=$self and id(old)=$old "
-            "MATCH " + old_rel + " RETURN r", {'old': old_node.id})
-        if result:
-            node_properties = _get_node_properties(result[0][0])
-            existing_properties = node_properties.keys()
-        else:
-            raise NotConnected('reconnect', self.source, old_node)
-
-        # remove old relationship and create new one
-        new_rel = _rel_merge_helper(lhs='us', rhs='new', ident='r2', **self.definition)
-        q = "MATCH (us), (old), (new) " \
-            "WHERE id(us)=$self and id(old)=$old and id(new)=$new " \
-            "MATCH " + old_rel
-        q += " MERGE" + new_rel
-
-        # copy over properties if we have
-        for p in existing_properties:
-            q += " SET r2.{0} = r.{1}".format(p, p)
-        q += " WITH r DELETE r"
 
-        self.source.cypher(q, {'old': old_node.id, 'new': new_node.id})
+        result, _ = self.source.cypher(_reconnect_query(self._definition_key),
+                                       {'old': old_node.id, 'new': new_node.id})
+        if not result[0][0]:
+            raise NotConnected('reconnect', self.source, old_node)
 
     @check_source
     def disconnect(self, node):
@@ -286,9 +381,8 @@ class RelationshipManager(object):
         :param node:
         :return:
         """
-        rel = _rel_helper(lhs='a', rhs='b', ident='r', **self.definition)
-        q = "MATCH (a), (b) WHERE id(a)=$self and id(b)=$them " \
-            "MATCH " + rel + " DELETE r"
+        q = _rel_query("MATCH (a), (b) WHERE id(a)=$self and id(b)=$them MATCH ",
+                       'a', 'b', 'r', self._definition_key, " DELETE r")
         self.source.cypher(q, {'them': node.id})
 
     @check_source
@@ -298,14 +392,23 @@ class RelationshipManager(object):
 
         :return:
         """
-        rhs = 'b:' + self.definition['node_class'].__label__
-        rel = _rel_helper(lhs='a', rhs=rhs, ident='r', **self.definition)
-        q = 'MATCH (a) WHERE id(a)=$self MATCH ' + rel + ' DELETE r'
-        self.source.cypher(q)
+        if self._disconnect_all_q is None:
+            rhs = 'b:' + self._node_class.__label__
+            self._disconnect_all_q = _rel_query('MATCH (a) WHERE id(a)=$self MATCH ', 'a', rhs, 'r',
+                                                self._definition_key, ' DELETE r')
+        self.source.cypher(self._disconnect_all_q)
 
     @check_source
+    def _traversal(self):
+        """
+        The traversal for this relationship, shared by every operation that doesn't modify it.
+        """
+        if self._traversal_template is None:
+            self._traversal_template = Traversal(self.source, self.name, self.definition)
+        return self._traversal_template
+
     def _new_traversal(self):
-        return Traversal(self.source, self.name, self.definition)
+        return self._traversal().clone()
 
     # The methods below simply proxy the match engine.
     def get(self, **kwargs):
@@ -315,7 +418,16 @@ class RelationshipManager(object):
         :param kwargs: same syntax as `NodeSet.filter()`
         :return: node
         """
-        return NodeSet(self._new_traversal()).get(**kwargs)
+        if kwargs:
+            return NodeSet(self._traversal()).get(**kwargs)
+
+        # without filters the traversal can be queried directly
+        nodes = self._new_traversal()[:2]
+        if len(nodes) > 1:
+            raise MultipleNodesReturned(repr(kwargs))
+        elif not nodes:
+            raise self._node_class.DoesNotExist(repr(kwargs))
+        return nodes[0]
 
     def get_or_none(self, **kwargs):
         """
@@ -324,7 +436,10 @@ class RelationshipManager(object):
         :param kwargs: same syntax as `NodeSet.filter()`
         :return: node
         """
-        return NodeSet(self._new_traversal()).get_or_none(**kwargs)
+        try:
+            return self.get(**kwargs)
+        except self._node_class.DoesNotExist:
+            pass
 
     @deprecated("search() is now deprecated please use filter() and exclude()")
     def search(self, **kwargs):
@@ -344,7 +459,7 @@ class RelationshipManager(object):
         :param kwargs: same syntax as `NodeSet.filter()`
         :return: NodeSet
         """
-        return NodeSet(self._new_traversal()).filter(*args, **kwargs)
+        return NodeSet(self._traversal()).filter(*args, **kwargs)
 
     def order_by(self, *props):
         """
@@ -353,7 +468,7 @@ class RelationshipManager(object):
         :param props:
         :return: NodeSet
         """
-        return NodeSet(self._new_traversal()).order_by(*props)
+        return NodeSet(self._traversal()).order_by(*props)
 
     def exclude(self, *args, **kwargs):
         """
@@ -363,7 +478,7 @@ class RelationshipManager(object):
         :param kwargs: same syntax as `NodeSet.filter()`
         :return: NodeSet
         """
-        return NodeSet(self._new_traversal()).exclude(*args, **kwargs)
+        return NodeSet(self._traversal()).exclude(*args, **kwargs)
 
     def is_connected(self, node):
         """
@@ -371,7 +486,7 @@ class RelationshipManager(object):
         :param node:
         :return: bool
         """
-        return self._new_traversal().__contains__(node)
+        return self._traversal().__contains__(node)
 
     def single(self):
         """
@@ -391,7 +506,7 @@ class RelationshipManager(object):
         :param kwargs: same syntax as `NodeSet.filter()`
         :return: NodeSet
         """
-        return self._new_traversal().match(**kwargs)
+        return self._traversal().match(**kwargs)
 
     def all(self):
         """
@@ -399,7 +514,7 @@ class RelationshipManager(object):
 
         :return: list
         """
-        return self._new_traversal().all()
+        return self._traversal().all()
 
     def values(self, *args):
         """
@@ -408,46 +523,45 @@ class RelationshipManager(object):
         :param args: string field names
         :return: NodeSet
         """
-        return NodeSet(self._new_traversal()).values(*args)
+        return NodeSet(self._traversal()).values(*args)
 
     def __iter__(self):
-        return self._new_traversal().__iter__()
+        return self._traversal().__iter__()
 
     def __len__(self):
-        return self._new_traversal().__len__()
+        return self._traversal().__len__()
 
     def __bool__(self):
-        return self._new_traversal().__bool__()
+        return self._traversal().__bool__()
 
     def __nonzero__(self):
-        return self._new_traversal().__nonzero__()
+        return self._traversal().__nonzero__()
 
     def __contains__(self, obj):
-        return self._new_traversal().__contains__(obj)
+        return self._traversal().__contains__(obj)
 
     def __getitem__(self, key):
         return self._new_traversal().__getitem__(key)
 
 
 class RelationshipDefinition(object):
-    def __init__(self, relation_type, cls_name, direction, manager=RelationshipManager, model=None):
-        current_frame = inspect.currentframe()
-
-        def enumerate_traceback(initial_frame):
-            depth, frame = 0, initial_frame
-            while frame is not None:
-                yield depth, frame
-                frame = frame.f_back
-                depth += 1
+    __slots__ = ('module_name', 'module_file', '_raw_class', 'manager', 'definition')
 
+    def __init__(self, relation_type, cls_name, direction, manager=RelationshipManager, model=None):
+        # the declaring module is the first one up the stack that knows about cls_name
         frame_number = 4
-        for i, frame in enumerate_traceback(current_frame):
-            if cls_name in frame.f_globals:
-                frame_number = i
+        for i in range(_MAX_FRAME_DEPTH):
+            try:
+                if cls_name in sys._getframe(i).f_globals:
+                    frame_number = i
+                    break
+            except ValueError:
+                # the call stack is not that deep
                 break
-        self.module_name = sys._getframe(frame_number).f_globals['__name__']
-        if '__file__' in sys._getframe(frame_number).f_globals:
-            self.module_file = sys._getframe(frame_number).f_globals['__file__']
+        module_globals = sys._getframe(frame_number).f_globals
+        self.module_name = module_globals['__name__']
+        if '__file__' in module_globals:
+            self.module_file = module_globals['__file__']
         self._raw_class = cls_name
         self.manager = manager
         self.definition = {}
@@ -457,26 +571,20 @@ class RelationshipDefinition(object):
 
         if model is not None:
             # Relationships are easier to instantiate because (at the moment), they cannot have multiple labels. So, a
-            # relationship's type determines the class that should be instantiated uniquely. Here however, we still use
-            # a `frozenset([relation_type])` to preserve the mapping type.
-            label_set = frozenset([relation_type])
-            try:
-                # If the relationship mapping exists then it is attempted to be redefined so that it applies to the same
-                # label. In this case, it has to be ensured that the class that is overriding the relationship is a
-                # descendant of the already existing class
-                model_from_registry = db._NODE_CLASS_REGISTRY[label_set]
-                if not issubclass(model, model_from_registry):
-                    is_parent = issubclass(model_from_registry, model)
-                    if is_direct_subclass(model, StructuredRel) and not is_parent:
-                        raise RelationshipClassRedefined(relation_type, db._NODE_CLASS_REGISTRY, model)
-                else:
-                    db._NODE_CLASS_REGISTRY[label_set] = model
-            except KeyError:
-                # If the mapping does not exist then it is simply created.
+            # relationship's type determines the class that should be instantiated uniquely. It is registered under
+            # the 1-tuple `(relation_type,)`, which can't collide with the frozenset label keys used for nodes.
+            label_set = (relation_type,)
+            model_from_registry = db._NODE_CLASS_REGISTRY.get(label_set)
+            if model_from_registry is None or issubclass(model, model_from_registry):
+                # If the mapping does not exist then it is simply created. If it exists and is attempted to be
+                # redefined, the class that is overriding the relationship has to be a descendant of the already
+                # existing class
                 db._NODE_CLASS_REGISTRY[label_set] = model
+            elif is_direct_subclass(model, StructuredRel) and not issubclass(model_from_registry, model):
+                raise RelationshipClassRedefined(relation_type, db._NODE_CLASS_REGISTRY, model)
 
     def _lookup_node_class(self):
-        if not isinstance(self._raw_class, basestring):
+        if not isinstance(self._raw_class, str):
             self.definition['node_class'] = self._raw_class
         else:
             name = self._raw_class
@@ -521,11 +629,12 @@ class ZeroOrMore(RelationshipManager):
     """
     A relationship of zero or more nodes (the default)
     """
+    __slots__ = ()
     description = "zero or more relationships"
 
 
 def _relate(cls_name, direction, rel_type, cardinality=None, model=None):
-    if not isinstance(cls_name, (basestring, object)):
+    if not isinstance(cls_name, (str, type)):
         raise ValueError('Expected class name or class got ' + repr(cls_name))
 
     if model and not issubclass(model, (StructuredRel,)):
@@ -216,7 +216,7 @@ class Database(local, NodeClassRegistry):
                             a_result_attribute[1])
 
                     if isinstance(a_result_attribute[1], Relationship):
-                        resolved_object = self._NODE_CLASS_REGISTRY[frozenset([a_result_attribute[1].type])].inflate(
+                        resolved_object = self._NODE_CLASS_REGISTRY[(a_result_attribute[1].type,)].inflate(
                             a_result_attribute[1])
 
                     if type(a_result_attribute[1]) is list:
@@ -68,6 +68,11 @@ def test_cardinality_zero_or_one():
     m.driver.reconnect(h, j)
     assert m.driver.single().version == 2
 
+    # ZeroOrOne overrides connect so replace goes through disconnect_all and connect
+    m.driver.replace(h)
+    assert len(m.driver.all()) == 1
+    assert m.driver.single().version == 1
+
 
 def test_cardinality_one_or_more():
     m = Monkey(name='jerry').save()
@@ -105,3 +110,6 @@ def test_cardinality_one():
 
     with raises(AttemptedCardinalityViolation):
         m.toothbrush.disconnect(b)
+
+    with raises(AttemptedCardinalityViolation):
+        m.toothbrush.replace(b)
@@ -370,7 +370,7 @@ def test_resolve_inexistent_relationship():
     """
 
     # Forget about the FRIENDS_WITH Relationship.
-    del neomodel.db._NODE_CLASS_REGISTRY[frozenset(["FRIENDS_WITH"])]
+    del neomodel.db._NODE_CLASS_REGISTRY[("FRIENDS_WITH",)]
 
     with pytest.raises(neomodel.RelationshipClassNotDefined):
         query_data = neomodel.db.cypher_query("MATCH (:ExtendedSomePerson)-[r:FRIENDS_WITH]->(:ExtendedSomePerson) "
@@ -103,6 +103,18 @@ def test_simple_traverse_with_filter():
     assert results[0].name == 'Sainsburys'
 
 
+def test_traversal_match_leaves_original_unchanged():
+    nescafe = Coffee(name='Nescafe3', price=99).save()
+    traversal = NodeSet(source=nescafe).suppliers
+
+    fedex = traversal.match(courier='fedex')
+    assert fedex is not traversal
+    assert not traversal.filters
+    assert len(fedex.filters) == 1
+    assert len(fedex.match(since__lt=datetime.now()).filters) == 2
+    assert len(fedex.filters) == 1
+
+
 def test_double_traverse():
     nescafe = Coffee(name='Nescafe plus', price=99).save()
     tesco = Supplier(name='Asda', delivery_cost=2).save()
@@ -1,10 +1,12 @@
 from datetime import datetime
+from uuid import uuid4
 
 from pytest import raises
 import pytz
 
 from neomodel import (StructuredNode, StructuredRel, Relationship, RelationshipTo,
-                      StringProperty, DateTimeProperty, DeflateError)
+                      StringProperty, DateTimeProperty, DeflateError, UniqueIdProperty,
+                      UniqueUUIDProperty)
 
 HOOKS_CALLED = {
     'pre_save': 0,
@@ -30,13 +32,20 @@ class Badger(StructuredNode):
     name = StringProperty(unique_index=True)
     friend = Relationship('Badger', 'FRIEND', model=FriendRel)
     hates = RelationshipTo('Stoat', 'HATES', model=HatesRel)
+    bites = RelationshipTo('Weasel', 'BITES')
 
 
 class Stoat(StructuredNode):
+    uuid = UniqueIdProperty()
     name = StringProperty(unique_index=True)
     hates = RelationshipTo('Badger', 'HATES', model=HatesRel)
 
 
+class Weasel(StructuredNode):
+    uuid = UniqueUUIDProperty()
+    name = StringProperty(unique_index=True)
+
+
 def test_either_connect_with_rel_model():
     paul = Badger(name="Paul").save()
     tom = Badger(name="Tom").save()
@@ -133,6 +142,90 @@ def test_retrieve_all_rels():
     assert rels[1].id in [rel_a.id, rel_b.id]
 
 
+def test_bulk_connect_with_rel_model():
+    tom = Badger(name="tom the bulk badger").save()
+    ian = Stoat(name="ian the bulk stoat").save()
+    bob = Stoat(name="bob the bulk stoat").save()
+
+    rels = tom.hates.bulk_connect([ian.uuid, bob.uuid], 'Stoat', [{'reason': 'a'}, {'reason': 'b'}])
+    assert len(rels) == 2
+    assert all(isinstance(rel, HatesRel) for rel in rels)
+    assert [rel.reason for rel in rels] == ['a', 'b']
+
+    assert tom.hates.relationship(ian).reason == 'a'
+    assert tom.hates.relationship(bob).reason == 'b'
+
+    tom.hates.bulk_disconnect((ian.uuid,))
+    assert not tom.hates.is_connected(ian)
+    tom.hates.bulk_disconnect([bob.uuid], 'Stoat')
+    assert not tom.hates.is_connected(bob)
+
+
+def test_bulk_connect_with_uuid_objects():
+    tom = Badger(name="tom the biting badger").save()
+    ids = [uuid4(), uuid4()]
+    weasels = [Weasel(uuid=ids[0], name="wes").save(), Weasel(uuid=ids[1], name="will").save()]
+
+    assert tom.bites.bulk_connect(ids, 'Weasel') is True
+    assert all(tom.bites.is_connected(weasel) for weasel in weasels)
+
+    tom.bites.bulk_disconnect(ids)
+    assert not any(tom.bites.is_connected(weasel) for weasel in weasels)
+
+
+def test_bulk_connect_keeps_node_order():
+    tom = Badger(name="tom the orderly badger").save()
+    stoats = [Stoat(name="orderly stoat {0}".format(i)).save() for i in range(3)]
+
+    # the unset reason puts the middle row in a separate batch
+    rels = tom.hates.bulk_connect([stoat.uuid for stoat in stoats], 'Stoat',
+                                  [{'reason': 'a'}, {'reason': None}, {'reason': 'b'}])
+    assert [rel.reason for rel in rels] == ['a', None, 'b']
+
+
+def test_bulk_connect_properties_length_mismatch():
+    tom = Badger(name="tom the miscounting badger").save()
+    ian = Stoat(name="ian the uncounted stoat").save()
+    bob = Stoat(name="bob the uncounted stoat").save()
+
+    with raises(ValueError):
+        tom.hates.bulk_connect([ian.uuid, bob.uuid], 'Stoat', [{'reason': 'a'}])
+
+    with raises(ValueError):
+        tom.hates.bulk_connect([ian.uuid], 'Stoat', [{'reason': 'a'}, {'reason': 'b'}])
+
+    assert not tom.hates.is_connected(ian)
+    assert not tom.hates.is_connected(bob)
+
+
+def test_reconnect_with_rel_model():
+    ian = Stoat(name="ian the reconnecting stoat").save()
+    paul = Badger(name="paul the old badger").save()
+    tom = Badger(name="tom the new badger").save()
+
+    ian.hates.connect(paul, {'reason': 'too stripy'})
+    ian.hates.reconnect(paul, tom)
+
+    assert not ian.hates.is_connected(paul)
+    rel = ian.hates.relationship(tom)
+    assert isinstance(rel, HatesRel)
+    assert rel.reason == 'too stripy'
+
+
+def test_replace_with_rel_model():
+    tom = Badger(name="tom the fickle badger").save()
+    ian = Stoat(name="ian the old foe").save()
+    bob = Stoat(name="bob the new foe").save()
+
+    tom.hates.connect(ian, {'reason': 'a'})
+    rel = tom.hates.replace(bob, {'reason': 'b'})
+    assert isinstance(rel, HatesRel)
+    assert rel.reason == 'b'
+
+    assert not tom.hates.is_connected(ian)
+    assert tom.hates.is_connected(bob)
+
+
 def test_save_hook_on_rel_model():
     HOOKS_CALLED['pre_save'] = 0
     HOOKS_CALLED['post_save'] = 0
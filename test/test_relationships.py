@@ -1,7 +1,8 @@
 from pytest import raises
 
 from neomodel import (StructuredNode, RelationshipTo, RelationshipFrom, Relationship,
-                      StringProperty, IntegerProperty, StructuredRel, One, Q)
+                      StringProperty, IntegerProperty, StructuredRel, One, Q, NotConnected)
+from neomodel.exceptions import MultipleNodesReturned
 
 class PersonWithRels(StructuredNode):
     name = StringProperty(unique_index=True)
@@ -118,6 +119,22 @@ def test_search_and_filter_and_exclude():
     assert len(result) == 3
 
 
+
+def test_get_without_filters():
+    ned = PersonWithRels(name='Ned', age=14).save()
+    assert ned.is_from.get_or_none() is None
+    with raises(Country.DoesNotExist):
+        ned.is_from.get()
+
+    ua = Country(code='UA').save()
+    ned.is_from.connect(ua)
+    assert ned.is_from.get().code == 'UA'
+    assert ned.is_from.get_or_none().code == 'UA'
+
+    ned.is_from.connect(Country(code='UB').save())
+    with raises(MultipleNodesReturned):
+        ned.is_from.get()
+
 def test_custom_methods():
     u = PersonWithRels(name='Joe90', age=13).save()
     assert u.special_power() == "I have no powers"
@@ -126,6 +143,11 @@ def test_custom_methods():
     assert u.special_name == 'Joe91'
 
 
+def test_invalid_relationship_target():
+    with raises(ValueError):
+        RelationshipTo(42, 'IS_FROM')
+
+
 def test_valid_reconnection():
     p = PersonWithRels(name='ElPresidente', age=93).save()
     assert p
@@ -148,6 +170,16 @@ def test_valid_reconnection():
     assert c.president.is_connected(pp)
 
 
+def test_reconnect_not_connected():
+    u = PersonWithRels(name='Unattached', age=30).save()
+    nl = Country(code='NL').save()
+    be = Country(code='BE').save()
+
+    with raises(NotConnected):
+        u.is_from.reconnect(nl, be)
+    assert not u.is_from.is_connected(be)
+
+
 def test_valid_replace():
     brady = PersonWithRels(name='Tom Brady', age=40).save()
     assert brady